@@ -1,7 +1,6 @@
 from functools import cached_property
 
 from django.contrib import admin
-from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
 from auditlog.filters import ResourceTypeFilter
@@ -51,5 +50,4 @@ class LogEntryAdmin(admin.ModelAdmin, LogEntryAdminMixin):
         return False
 
     def get_queryset(self, request):
-        self.request = request
-        return super().get_queryset(request=request)
+        return super().get_queryset(request=request).select_related("content_type")
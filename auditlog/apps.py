@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 from django.utils.translation import gettext_lazy as _
 
 
@@ -14,4 +15,7 @@ class AuditlogConfig(AppConfig):
 
         from auditlog import models
 
-        models.changes_func = models._changes_func()
+        post_migrate.connect(
+            models._clear_content_type_cache,
+            dispatch_uid="auditlog_clear_content_type_cache",
+        )
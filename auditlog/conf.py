@@ -40,3 +40,6 @@ settings.AUDITLOG_TWO_STEP_MIGRATION = getattr(
 settings.AUDITLOG_USE_TEXT_CHANGES_IF_JSON_IS_NOT_PRESENT = getattr(
     settings, "AUDITLOG_USE_TEXT_CHANGES_IF_JSON_IS_NOT_PRESENT", False
 )
+
+# Number of log entries written per query by the `batch_auditlog` context manager
+settings.AUDITLOG_BULK_BATCH_SIZE = getattr(settings, "AUDITLOG_BULK_BATCH_SIZE", 1000)
@@ -1,12 +1,10 @@
 import contextlib
-import time
 from contextvars import ContextVar
-from functools import partial
 
-from django.contrib.auth import get_user_model
-from django.db.models.signals import pre_save
+from django.db import transaction
 
-from auditlog.models import LogEntry
+from auditlog.conf import settings
+from auditlog.models import LogEntry, auditlog_pending
 
 auditlog_value = ContextVar("auditlog_value")
 auditlog_disabled = ContextVar("auditlog_disabled", default=False)
@@ -22,3 +20,33 @@ def disable_auditlog():
             auditlog_disabled.reset(token)
         except LookupError:
             pass
+
+
+@contextlib.contextmanager
+def batch_auditlog():
+    """
+    Collect the log entries created inside the block and write them with
+    ``bulk_create`` when the block exits, instead of one INSERT per entry.
+
+    The block runs in ``transaction.atomic()``, so the changes made in it and their
+    log entries are committed or rolled back together. A nested block is a savepoint:
+    its entries are handed to the enclosing block when it exits cleanly and dropped
+    with its changes when it raises.
+
+    Log entries passed to ``post_log`` receivers inside the block are not saved yet.
+    """
+    parent = auditlog_pending.get()
+    pending = []
+    token = auditlog_pending.set(pending)
+    try:
+        with transaction.atomic():
+            yield
+            if parent is None and pending:
+                LogEntry.objects.bulk_create(
+                    pending, batch_size=settings.AUDITLOG_BULK_BATCH_SIZE
+                )
+    finally:
+        auditlog_pending.reset(token)
+
+    if parent is not None:
+        parent.extend(pending)
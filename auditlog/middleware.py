@@ -1,6 +1,3 @@
-from django.contrib.auth import get_user_model
-
-
 class AuditlogMiddleware:
     """
     Middleware to couple the request's user to log items. This is accomplished by currying the
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auditlog", "0019_alter_logentry_source"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="logentry",
+            index=models.Index(
+                fields=["content_type", "timestamp"], name="auditlog_ct_ts_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auditlog", "0020_logentry_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="logentry",
+            index=models.Index(
+                fields=["content_type", "identifier"], name="auditlog_ct_identifier_idx"
+            ),
+        ),
+    ]
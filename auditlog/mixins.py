@@ -1,30 +1,44 @@
+from functools import lru_cache
+
 from django import urls as urlresolvers
 from django.conf import settings
 from django.contrib import admin
-from django.core.exceptions import FieldDoesNotExist
 from django.forms.utils import pretty_name
-from django.http import HttpRequest
 from django.urls.exceptions import NoReverseMatch
 from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
-from django.utils.timezone import is_aware, localtime
+from django.utils.timezone import get_current_timezone, is_aware
 from django.utils.translation import gettext_lazy as _
 
-from auditlog.models import LogEntry
+from auditlog.context import batch_auditlog
+from auditlog.models import LogEntry, _get_field_meta
 from auditlog.registry import auditlog
 from auditlog.signals import accessed
 
 MAX = 75
 
 
-class LogEntryAdminMixin:
-    request: HttpRequest
+def _model_field_verbose_name(model, field_name: str):
+    # The verbose name is translated on each call, only the field lookup is cached.
+    field_meta = _get_field_meta(model, field_name)
+    if field_meta is None:
+        return pretty_name(field_name)
+    return pretty_name(getattr(field_meta[0], "verbose_name", field_name))
+
+
+@lru_cache(maxsize=16)
+def _row_template(cells: int, cell: str):
+    return "<tr>" + cell * cells + "</tr>"
+
 
+class LogEntryAdminMixin:
     @admin.display(description=_("Created"))
     def created(self, obj):
-        if is_aware(obj.timestamp):
-            return localtime(obj.timestamp)
-        return obj.timestamp
+        timestamp = obj.timestamp
+        if is_aware(timestamp):
+            # localtime() would repeat the awareness check
+            return timestamp.astimezone(get_current_timezone())
+        return timestamp
 
     @admin.display(description=_("User"))
     def user_url(self, obj):
@@ -51,7 +65,7 @@ class LogEntryAdminMixin:
     def msg_short(self, obj):
         if obj.action in [LogEntry.Action.DELETE, LogEntry.Action.ACCESS]:
             return ""  # delete
-        change_value = obj.changes_dict
+        change_value = self._changes(obj)
         s = "" if len(change_value) == 1 else "s"
         fields = ", ".join(change_value.keys())
         if len(fields) > MAX:
@@ -61,7 +75,9 @@ class LogEntryAdminMixin:
 
     @admin.display(description=_("Changes"))
     def msg(self, obj):
-        change_value = obj.changes_dict
+        change_value = self._changes(obj)
+        if not change_value:
+            return ""
 
         atom_changes = {}
         m2m_changes = {}
@@ -75,51 +91,69 @@ class LogEntryAdminMixin:
             else:
                 atom_changes[field] = change_value
 
-        msg = []
+        atom_html = m2m_html = ""
 
         if atom_changes:
-            msg.append("<table>")
-            msg.append(self._format_header("#", "Field", "From", "To"))
-            for i, (field, change_value) in enumerate(sorted(atom_changes.items()), 1):
-                value = [i, self.field_verbose_name(obj, field)] + (
-                    ["***", "***"] if field == "password" else change_value
-                )
-                msg.append(self._format_line(*value))
-            msg.append("</table>")
+            rows = format_html_join(
+                "",
+                _row_template(4, "<td>{}</td>"),
+                (
+                    (
+                        i,
+                        self.field_verbose_name(obj, field),
+                        *(["***", "***"] if field == "password" else change_value),
+                    )
+                    for i, (field, change_value) in enumerate(
+                        sorted(atom_changes.items()), 1
+                    )
+                ),
+            )
+            atom_html = format_html(
+                "<table>{}{}</table>",
+                self._format_header("#", "Field", "From", "To"),
+                rows,
+            )
 
         if m2m_changes:
-            msg.append("<table>")
-            msg.append(self._format_header("#", "Relationship", "Action", "Objects"))
-            for i, (field, change_value) in enumerate(sorted(m2m_changes.items()), 1):
-                change_html = format_html_join(
-                    mark_safe("<br>"),
-                    "{}",
-                    [(value,) for value in change_value["objects"]],
-                )
-
-                msg.append(
-                    format_html(
-                        "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>",
+            rows = format_html_join(
+                "",
+                _row_template(4, "<td>{}</td>"),
+                (
+                    (
                         i,
                         self.field_verbose_name(obj, field),
                         change_value["operation"],
-                        change_html,
+                        format_html_join(
+                            mark_safe("<br>"),
+                            "{}",
+                            ((value,) for value in change_value["objects"]),
+                        ),
+                    )
+                    for i, (field, change_value) in enumerate(
+                        sorted(m2m_changes.items()), 1
                     )
-                )
+                ),
+            )
+            m2m_html = format_html(
+                "<table>{}{}</table>",
+                self._format_header("#", "Relationship", "Action", "Objects"),
+                rows,
+            )
 
-            msg.append("</table>")
+        return format_html("{}{}", atom_html, m2m_html)
 
-        return mark_safe("".join(msg))
+    def _changes(self, obj):
+        """
+        Return ``obj.changes_dict``, cached on the instance so the columns rendered for
+        the same row do not each rebuild it.
+        """
+        changes = obj.__dict__.get("_cached_changes")
+        if changes is None:
+            changes = obj.__dict__["_cached_changes"] = obj.changes_dict
+        return changes
 
     def _format_header(self, *labels):
-        return format_html(
-            "".join(["<tr>", "<th>{}</th>" * len(labels), "</tr>"]), *labels
-        )
-
-    def _format_line(self, *values):
-        return format_html(
-            "".join(["<tr>", "<td>{}</td>" * len(values), "</tr>"]), *values
-        )
+        return format_html(_row_template(len(labels), "<th>{}</th>"), *labels)
 
     def field_verbose_name(self, obj, field_name: str):
         model = obj.content_type.model_class()
@@ -133,21 +167,28 @@ class LogEntryAdminMixin:
         except KeyError:
             # Model definition in auditlog was probably removed
             pass
-        try:
-            field = model._meta.get_field(field_name)
-            return pretty_name(getattr(field, "verbose_name", field_name))
-        except FieldDoesNotExist:
-            return pretty_name(field_name)
+        return _model_field_verbose_name(model, field_name)
 
-    def _add_query_parameter(self, key: str, value: str):
-        full_path = self.request.get_full_path()
+    def _add_query_parameter(self, request, key: str, value: str):
+        full_path = request.get_full_path()
         delimiter = "&" if "?" in full_path else "?"
 
         return f"{full_path}{delimiter}{key}={value}"
 
 
 class LogAccessMixin:
+    # Log access to every object in ``object_list`` with a single bulk insert
+    # instead of logging the object returned by ``get_object``. Views without an
+    # ``object_list`` still log ``get_object``.
+    batch_access = False
+
     def render_to_response(self, context, **response_kwargs):
-        obj = self.get_object()
-        accessed.send(obj.__class__, instance=obj)
+        object_list = context.get("object_list")
+        if self.batch_access and object_list is not None:
+            with batch_auditlog():
+                for obj in object_list:
+                    accessed.send(obj.__class__, instance=obj)
+        else:
+            obj = self.get_object()
+            accessed.send(obj.__class__, instance=obj)
         return super().render_to_response(context, **response_kwargs)
@@ -1,9 +1,14 @@
 import ast
 import contextlib
 import json
-from copy import deepcopy
-from datetime import timezone
-from typing import Any, Callable, Dict, List, Union
+from collections import defaultdict
+from contextvars import ContextVar
+from copy import copy
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID
 
 from dateutil import parser
 from dateutil.tz import gettz
@@ -17,7 +22,8 @@ from django.core.exceptions import (
     ValidationError,
 )
 from django.db import DEFAULT_DB_ALIAS, models
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
+from django.db.models.functions import Cast
 from django.utils import formats
 from django.utils import timezone as django_timezone
 from django.utils.encoding import smart_str
@@ -28,6 +34,128 @@ from auditlog.diff import mask_str
 
 DEFAULT_OBJECT_REPR = "<error forming object repr>"
 
+# Primary key fields whose values the database casts to text like smart_str does
+_CAST_IDENTIFIER_FIELDS = (models.IntegerField, models.CharField, models.TextField)
+
+# The log entries queued by auditlog.context.batch_auditlog, None outside of it
+auditlog_pending = ContextVar("auditlog_pending", default=None)
+
+
+@lru_cache(maxsize=None)
+def _get_content_type(model):
+    """
+    Return the content type for ``model``. Cleared on ``post_migrate``, when Django
+    clears its own content type cache.
+    """
+    return ContentType.objects.get_for_model(model)
+
+
+def _clear_content_type_cache(**kwargs):
+    _get_content_type.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(model):
+    return tuple(field.name for field in model._meta.fields)
+
+
+@lru_cache(maxsize=None)
+def _get_model_meta(model):
+    """
+    Return ``(pk attname, db_table)`` for ``model``. The ``attname`` of a primary key
+    that is a relation is its raw column, so no related object has to be unwrapped.
+    """
+    return model._meta.pk.attname, model._meta.db_table
+
+
+def _get_object_repr(instance) -> str:
+    """
+    Return the string representation logged as ``event_column`` for ``instance``.
+    """
+    try:
+        return smart_str(instance)
+    except ObjectDoesNotExist:
+        return DEFAULT_OBJECT_REPR
+
+
+def _parse_datetime(value: str) -> datetime:
+    """
+    Parse a logged date, time or datetime value. Values are logged in ISO format, so
+    try the much faster ``datetime.fromisoformat`` before ``dateutil``.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
+_JSON_SCALARS = (str, bool, int, float, type(None))
+
+
+def _is_normalized(value) -> bool:
+    """
+    Return whether ``value`` only holds JSON scalars, dicts, lists and tuples, like the
+    diffs built by the signal receivers, so :py:func:`_normalize` can be skipped.
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, dict):
+        return all(_is_normalized(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_is_normalized(item) for item in value)
+    return False
+
+
+def _normalize(value):
+    """
+    Convert ``value`` to the JSON types stored in :py:attr:`LogEntry.change_value`.
+    Decimals, UUIDs and model instances (by primary key) become strings and dates and
+    times become ISO strings, recursing into dicts, lists and tuples.
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, tuple):
+        # A plain tuple, as tuple subclasses such as named tuples take other arguments
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, models.Model):
+        return smart_str(value.pk)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_field_meta(model, field_name: str):
+    """
+    Return ``(field, choices_dict, internal_type)`` for the field used by
+    :py:attr:`LogEntry.changes_display_dict` and the admin, or ``None`` if the model has
+    no such field. ``internal_type`` is ``None`` for relations that don't have one.
+    """
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return None
+
+    # handle choices fields and Postgres ArrayField to get human-readable version
+    choices_dict = None
+    if getattr(field, "choices", []):
+        choices_dict = dict(field.choices)
+    if getattr(getattr(field, "base_field", None), "choices", []):
+        choices_dict = dict(field.base_field.choices)
+
+    try:
+        field_type = field.get_internal_type()
+    except AttributeError:
+        field_type = None
+
+    return field, choices_dict, field_type
+
 
 class LogEntryManager(models.Manager):
     """
@@ -49,27 +177,29 @@ class LogEntryManager(models.Manager):
         """
 
         change_value = kwargs.get("change_value", None)
-        pk = self._get_pk_value(instance)
-        table_name = self._get_table_name(instance)
 
         if change_value is not None or force_log:
-            kwargs.setdefault(
-                "content_type", ContentType.objects.get_for_model(instance)
-            )
+            if change_value is not None and not _is_normalized(change_value):
+                kwargs["change_value"] = _normalize(change_value)
+            pk_attname, table_name = _get_model_meta(type(instance))
+            pk = getattr(instance, pk_attname, None)
+            kwargs.setdefault("content_type", _get_content_type(type(instance)))
             kwargs.setdefault("identifier", pk)
             kwargs.setdefault("event_table", table_name)
-            try:
-                event_column = smart_str(instance)
-            except ObjectDoesNotExist:
-                event_column = DEFAULT_OBJECT_REPR
-            kwargs.setdefault("event_column", event_column)
+            if "event_column" not in kwargs:
+                kwargs["event_column"] = _get_object_repr(instance)
 
-            # set correlation id
-            return self.create(**kwargs)
+            return self._create_or_defer(**kwargs)
         return None
 
     def log_m2m_changes(
-        self, changed_queryset, instance, operation, field_name, **kwargs
+        self,
+        changed_queryset,
+        instance,
+        operation,
+        field_name,
+        display_field=None,
+        **kwargs,
     ):
         """Create a new "changed" log entry from m2m record.
 
@@ -81,27 +211,32 @@ class LogEntryManager(models.Manager):
         :type action: str
         :param field_name: The name of the changed m2m field.
         :type field_name: str
+        :param display_field: The field of the related objects to log. Only this column is
+            fetched. Defaults to the string representation of the related objects.
+        :type display_field: str
         :param kwargs: Field overrides for the :py:class:`LogEntry` object.
         :return: The new log entry or `None` if there were no changes.
         :rtype: LogEntry
         """
 
-        pk = self._get_pk_value(instance)
-        table_name = self._get_table_name(instance)
-        if changed_queryset:
-            kwargs.setdefault(
-                "content_type", ContentType.objects.get_for_model(instance)
-            )
+        if display_field:
+            objects = [
+                smart_str(value)
+                for value in changed_queryset.values_list(display_field, flat=True)
+            ]
+        else:
+            objects = [smart_str(obj) for obj in changed_queryset]
+
+        if objects:
+            pk_attname, table_name = _get_model_meta(type(instance))
+            pk = getattr(instance, pk_attname, None)
+            kwargs.setdefault("content_type", _get_content_type(type(instance)))
             kwargs.setdefault("identifier", pk)
             kwargs.setdefault("event_table", table_name)
-            try:
-                event_column = smart_str(instance)
-            except ObjectDoesNotExist:
-                event_column = DEFAULT_OBJECT_REPR
-            kwargs.setdefault("event_column", event_column)
+            if "event_column" not in kwargs:
+                kwargs["event_column"] = _get_object_repr(instance)
             kwargs.setdefault("action", LogEntry.Action.UPDATE)
 
-            objects = [smart_str(instance) for instance in changed_queryset]
             kwargs["change_value"] = {
                 field_name: {
                     "type": "m2m",
@@ -110,10 +245,23 @@ class LogEntryManager(models.Manager):
                 }
             }
 
-            return self.create(**kwargs)
+            return self._create_or_defer(**kwargs)
 
         return None
 
+    def _create_or_defer(self, **kwargs):
+        """
+        Create a log entry, or queue it for a bulk insert when called inside
+        :py:func:`auditlog.context.batch_auditlog`.
+        """
+        pending = auditlog_pending.get()
+        if pending is None:
+            return self.create(**kwargs)
+
+        log_entry = self.model(**kwargs)
+        pending.append(log_entry)
+        return log_entry
+
     def get_for_object(self, instance):
         """
         Get log entries for the specified model instance.
@@ -127,7 +275,7 @@ class LogEntryManager(models.Manager):
         if not isinstance(instance, models.Model):
             return self.none()
 
-        content_type = ContentType.objects.get_for_model(instance.__class__)
+        content_type = _get_content_type(instance.__class__)
         pk = self._get_pk_value(instance)
 
         if isinstance(pk, int):
@@ -141,32 +289,39 @@ class LogEntryManager(models.Manager):
 
         :param queryset: The queryset to get the log entries for.
         :type queryset: QuerySet
-        :return: The LogEntry objects for the objects in the given queryset.
+        :return: The LogEntry objects for the objects in the given queryset. Each log entry
+            is returned once.
         :rtype: QuerySet
         """
-        if not isinstance(queryset, QuerySet) or queryset.count() == 0:
+        if not isinstance(queryset, QuerySet):
             return self.none()
 
-        content_type = ContentType.objects.get_for_model(queryset.model)
-        primary_keys = list(
-            queryset.values_list(queryset.model._meta.pk.name, flat=True)
-        )
-
-        if isinstance(primary_keys[0], int):
-            return self.filter(content_type=content_type).distinct()
-        elif isinstance(queryset.model._meta.pk, models.UUIDField):
-            primary_keys = [smart_str(pk) for pk in primary_keys]
-            return (
-                self.filter(content_type=content_type)
-                .filter(Q(identifier__in=primary_keys))
-                .distinct()
+        content_type = _get_content_type(queryset.model)
+        pk_field = queryset.model._meta.pk
+        while pk_field.is_relation:
+            pk_field = pk_field.target_field
+
+        if (
+            isinstance(pk_field, _CAST_IDENTIFIER_FIELDS)
+            and queryset.db == self.db
+            and not queryset.query.is_sliced
+        ):
+            # The database casts these primary keys to the same text as smart_str, so
+            # match them in a subquery rather than sending every key as a parameter.
+            identifiers = (
+                queryset.order_by()
+                .annotate(
+                    auditlog_identifier=Cast("pk", output_field=models.CharField())
+                )
+                .values("auditlog_identifier")
             )
         else:
-            return (
-                self.filter(content_type=content_type)
-                .filter(Q(identifier__in=primary_keys))
-                .distinct()
-            )
+            identifiers = [
+                smart_str(pk) for pk in queryset.values_list("pk", flat=True)
+            ]
+        # Both filters are on LogEntry's own columns, so no join can duplicate rows
+        # and no DISTINCT is needed.
+        return self.filter(content_type=content_type, identifier__in=identifiers)
 
     def get_for_model(self, model):
         """
@@ -181,7 +336,7 @@ class LogEntryManager(models.Manager):
         if not issubclass(model, models.Model):
             return self.none()
 
-        content_type = ContentType.objects.get_for_model(model)
+        content_type = _get_content_type(model)
 
         return self.filter(content_type=content_type)
 
@@ -193,23 +348,8 @@ class LogEntryManager(models.Manager):
         :type instance: Model
         :return: The primary key value of the given model instance.
         """
-        pk_field = instance._meta.pk.name
-        pk = getattr(instance, pk_field, None)
-
-        # Check to make sure that we got a pk not a model object.
-        if isinstance(pk, models.Model):
-            pk = self._get_pk_value(pk)
-        return pk
-    
-    def _get_table_name(self, instance):
-        """
-        Get the table name for a model instance.
-        :param instance: The model instance to get the table name for.
-        :type instance: Model
-        :return: The table name of the given model instance.
-        """
-        table_name = instance._meta.db_table
-        return table_name
+        pk_attname, _table_name = _get_model_meta(type(instance))
+        return getattr(instance, pk_attname, None)
 
     def _get_copy_with_python_typed_fields(self, instance):
         """
@@ -219,12 +359,9 @@ class LogEntryManager(models.Manager):
         correctly typed to their respective fields. Updates made to an object's
         in-memory state may not meet this assumption. To prevent this violation, values
         are typed by calling `to_python` from the field object, the result is set on a
-        copy of the instance and the copy is sent to the serializer.
+        shallow copy of the instance and the copy is sent to the serializer.
         """
-        try:
-            instance_copy = deepcopy(instance)
-        except TypeError:
-            instance_copy = instance
+        instance_copy = copy(instance)
         for field in instance_copy._meta.fields:
             if not field.is_relation:
                 value = getattr(instance_copy, field.name)
@@ -239,26 +376,27 @@ class LogEntryManager(models.Manager):
     ) -> List[str]:
         include_fields = model_fields["include_fields"]
         exclude_fields = model_fields["exclude_fields"]
-        all_field_names = [field.name for field in instance._meta.fields]
+        all_field_names = _get_field_names(type(instance))
 
         if not include_fields and not exclude_fields:
-            return all_field_names
+            return list(all_field_names)
 
-        return list(set(include_fields or all_field_names).difference(exclude_fields))
+        return list(
+            frozenset(include_fields or all_field_names).difference(exclude_fields)
+        )
 
     def _mask_serialized_fields(
         self, data: Dict[str, Any], mask_fields: List[str]
     ) -> Dict[str, Any]:
-        all_field_data = data.pop("fields")
+        if not mask_fields:
+            return data
 
-        masked_field_data = {}
-        for key, value in all_field_data.items():
-            if isinstance(value, str) and key in mask_fields:
-                masked_field_data[key] = mask_str(value)
-            else:
-                masked_field_data[key] = value
+        all_field_data = data["fields"]
+        for key in frozenset(mask_fields).intersection(all_field_data):
+            value = all_field_data[key]
+            if isinstance(value, str):
+                all_field_data[key] = mask_str(value)
 
-        data["fields"] = masked_field_data
         return data
 
 
@@ -273,7 +411,7 @@ class LogEntry(models.Model):
     instances is not recommended (and it should not be necessary).
     """
 
-    class Action:
+    class Action(models.IntegerChoices):
         """
         The actions that Auditlog distinguishes: creating, updating and deleting objects. Viewing objects
         is not logged. The values of the actions are numeric, a higher integer value means a more intrusive
@@ -284,30 +422,16 @@ class LogEntry(models.Model):
         :py:attr:`Action.DELETE` and :py:attr:`Action.ACCESS`.
         """
 
-        CREATE = 0
-        UPDATE = 1
-        DELETE = 2
-        ACCESS = 3
-
-        choices = (
-            (CREATE, _("create")),
-            (UPDATE, _("update")),
-            (DELETE, _("delete")),
-            (ACCESS, _("access")),
-        )
+        CREATE = 0, _("create")
+        UPDATE = 1, _("update")
+        DELETE = 2, _("delete")
+        ACCESS = 3, _("access")
 
-    class Reason:
-        data_entry = "data_entry"
-        data_processing = "data_processing"
-        data_deletion = "data_deletion"
-        data_cleaning = "data_cleaning"
-
-        choices = (
-            (data_entry, _("data_entry")),
-            (data_processing, _("data_processing")),
-            (data_deletion, _("data_deletion")),
-            (data_cleaning, _("data_cleaning")),
-        )
+    class Reason(models.TextChoices):
+        data_entry = "data_entry", _("data_entry")
+        data_processing = "data_processing", _("data_processing")
+        data_deletion = "data_deletion", _("data_deletion")
+        data_cleaning = "data_cleaning", _("data_cleaning")
 
     source = models.CharField(
         max_length=255, verbose_name=_("source"), default="application"
@@ -352,17 +476,17 @@ class LogEntry(models.Model):
         ordering = ["-timestamp"]
         verbose_name = _("log entry")
         verbose_name_plural = _("log entries")
+        indexes = [
+            models.Index(
+                fields=["content_type", "timestamp"], name="auditlog_ct_ts_idx"
+            ),
+            models.Index(
+                fields=["content_type", "identifier"], name="auditlog_ct_identifier_idx"
+            ),
+        ]
 
     def __str__(self):
-        if self.action == self.Action.CREATE:
-            fstring = _("Created {repr:s}")
-        elif self.action == self.Action.UPDATE:
-            fstring = _("Updated {repr:s}")
-        elif self.action == self.Action.DELETE:
-            fstring = _("Deleted {repr:s}")
-        else:
-            fstring = _("Logged {repr:s}")
-
+        fstring = _ACTION_FSTRINGS.get(self.action, _DEFAULT_ACTION_FSTRING)
         return fstring.format(repr=self.event_column)
 
     @property
@@ -370,7 +494,7 @@ class LogEntry(models.Model):
         """
         :return: The changes recorded in this log entry as a dictionary object.
         """
-        return changes_func(self)
+        return self.change_value or {}
 
     @property
     def changes_str(self, colon=": ", arrow=" \u2192 ", separator="; "):
@@ -384,85 +508,82 @@ class LogEntry(models.Model):
         :param separator: The string to place between each field.
         :return: A readable string of the changes in this log entry.
         """
-        substrings = []
-
-        for field, values in self.changes_dict.items():
-            substring = "{field_name:s}{colon:s}{old:s}{arrow:s}{new:s}".format(
-                field_name=field,
-                colon=colon,
-                old=values[0],
-                arrow=arrow,
-                new=values[1],
-            )
-            substrings.append(substring)
-
-        return separator.join(substrings)
+        return separator.join(
+            f"{field}{colon}{values[0]}{arrow}{values[1]}"
+            for field, values in self.changes_dict.items()
+        )
 
     @property
     def changes_display_dict(self):
         """
         :return: The changes recorded in this log entry intended for display to users as a dictionary object.
         """
-        # Get the model and model_fields
+        # Get the model and model_fields. The registry can't be imported at module
+        # level, instantiating it imports the receivers which import this module.
         from auditlog.registry import auditlog
 
         model = self.content_type.model_class()
+        if model is None or not auditlog.contains(model._meta.model):
+            return self.changes_dict
         model_fields = auditlog.get_model_fields(model._meta.model)
         changes_display_dict = {}
+        changes = self.changes_dict
+        related_objects = self._get_fk_related_objects(model, changes)
+        # looked up on the first DateTimeField value
+        local_tz = None
         # grab the changes_dict and iterate through
-        for field_name, values in self.changes_dict.items():
+        for field_name, values in changes.items():
             # try to get the field attribute on the model
-            try:
-                field = model._meta.get_field(field_name)
-            except FieldDoesNotExist:
+            field_meta = _get_field_meta(model, field_name)
+            if field_meta is None:
                 changes_display_dict[field_name] = values
                 continue
+            field, choices_dict, field_type = field_meta
             values_display = []
-            # handle choices fields and Postgres ArrayField to get human-readable version
-            choices_dict = None
-            if getattr(field, "choices", []):
-                choices_dict = dict(field.choices)
-            if getattr(getattr(field, "base_field", None), "choices", []):
-                choices_dict = dict(field.base_field.choices)
 
             if choices_dict:
                 for value in values:
-                    try:
-                        value = ast.literal_eval(value)
-                        if type(value) is [].__class__:
-                            values_display.append(
-                                ", ".join(
-                                    [choices_dict.get(val, "None") for val in value]
-                                )
-                            )
-                        else:
-                            values_display.append(choices_dict.get(value, "None"))
-                    except Exception:
+                    # Only parse values that aren't a choice key already, e.g. the
+                    # string form of an integer choice or of an ArrayField list
+                    if isinstance(value, str) and value not in choices_dict:
+                        try:
+                            value = ast.literal_eval(value)
+                        except Exception:
+                            pass
+                    if isinstance(value, list):
+                        values_display.append(
+                            ", ".join([choices_dict.get(val, "None") for val in value])
+                        )
+                    else:
                         values_display.append(choices_dict.get(value, "None"))
             else:
-                try:
-                    field_type = field.get_internal_type()
-                except AttributeError:
+                if field_type is None:
                     # if the field is a relationship it has no internal type and exclude it
                     continue
                 for value in values:
                     # handle case where field is a datetime, date, or time type
                     if field_type in ["DateTimeField", "DateField", "TimeField"]:
                         try:
-                            value = parser.parse(value)
+                            value = _parse_datetime(value)
                             if field_type == "DateField":
                                 value = value.date()
                             elif field_type == "TimeField":
                                 value = value.time()
                             elif field_type == "DateTimeField":
+                                if local_tz is None:
+                                    local_tz = gettz(settings.TIME_ZONE)
                                 value = value.replace(tzinfo=timezone.utc)
-                                value = value.astimezone(gettz(settings.TIME_ZONE))
+                                value = value.astimezone(local_tz)
                             value = formats.localize(value)
                         except ValueError:
                             pass
                     elif field_type in ["ForeignKey", "OneToOneField"]:
-                        value = self._get_changes_display_for_fk_field(field, value)
+                        value = self._get_changes_display_for_fk_field(
+                            field_name, field, value, related_objects
+                        )
 
+                    if not isinstance(value, str):
+                        value = str(value)
                     # check if length is longer than 140 and truncate with ellipsis
                     if len(value) > 140:
                         value = f"{value[:140]}..."
@@ -474,30 +595,78 @@ class LogEntry(models.Model):
             changes_display_dict[verbose_name] = values_display
         return changes_display_dict
 
+    def _get_fk_related_objects(
+        self, model, changes: Dict[str, Any]
+    ) -> Dict[Tuple[str, str], Optional[models.Model]]:
+        """
+        Fetch the objects referenced by the FK values in ``changes``, with one query per
+        related model.
+
+        :return: A dict mapping each ``(field name, value)`` to the referenced object, or to
+            ``None`` if it was deleted. Values that aren't a PK of the related model are left
+            out.
+        """
+        fk_values = {}
+        for field_name, values in changes.items():
+            field_meta = _get_field_meta(model, field_name)
+            if field_meta is None:
+                continue
+            field, choices_dict, field_type = field_meta
+            if choices_dict or field_type not in ["ForeignKey", "OneToOneField"]:
+                continue
+            related_model = field.related_model
+            for value in values:
+                if value == "None":
+                    continue
+                # ValidationError will handle legacy values where string representations
+                # were stored rather than PKs. This will also handle cases where the PK type
+                # is changed between the time the LogEntry is created and this method is
+                # called.
+                try:
+                    pk_value = related_model._meta.pk.to_python(value)
+                except ValidationError:
+                    continue
+                fk_values[(field_name, smart_str(value))] = (related_model, pk_value)
+
+        pk_values = defaultdict(set)
+        for related_model, pk_value in fk_values.values():
+            pk_values[related_model].add(pk_value)
+        objects = {
+            related_model: related_model.objects.in_bulk(list(pks))
+            for related_model, pks in pk_values.items()
+        }
+        return {
+            key: objects[related_model].get(pk_value)
+            for key, (related_model, pk_value) in fk_values.items()
+        }
+
     def _get_changes_display_for_fk_field(
-        self, field: Union[models.ForeignKey, models.OneToOneField], value: Any
+        self,
+        field_name: str,
+        field: Union[models.ForeignKey, models.OneToOneField],
+        value: Any,
+        related_objects: Dict[Tuple[str, str], Optional[models.Model]],
     ) -> str:
         """
         :return: A string representing a given FK value and the field to which it belongs
         """
-        # Return "None" if the FK value is "None".
-        if value == "None":
-            return value
-
-        # Attempt to convert given value to the PK type for the related model
-        try:
-            pk_value = field.related_model._meta.pk.to_python(value)
-        # ValidationError will handle legacy values where string representations were
-        # stored rather than PKs. This will also handle cases where the PK type is
-        # changed between the time the LogEntry is created and this method is called.
-        except ValidationError:
+        key = (field_name, smart_str(value))
+        # "None" and values that aren't a PK of the related model are shown as they are
+        if key not in related_objects:
             return value
-        # Attempt to return the string representation of the object
-        try:
-            return smart_str(field.related_model.objects.get(pk=pk_value))
-        # ObjectDoesNotExist will be raised if the object was deleted.
-        except ObjectDoesNotExist:
+        related_object = related_objects[key]
+        # The object is missing if it was deleted.
+        if related_object is None:
             return f"Deleted '{field.related_model.__name__}' ({value})"
+        return smart_str(related_object)
+
+
+_ACTION_FSTRINGS = {
+    LogEntry.Action.CREATE: _("Created {repr:s}"),
+    LogEntry.Action.UPDATE: _("Updated {repr:s}"),
+    LogEntry.Action.DELETE: _("Deleted {repr:s}"),
+}
+_DEFAULT_ACTION_FSTRING = _("Logged {repr:s}")
 
 
 class AuditlogHistoryField(GenericRelation):
@@ -537,21 +706,3 @@ class AuditlogHistoryField(GenericRelation):
         # method.  However, because we don't want to delete these related
         # objects, we simply return an empty list.
         return []
-
-
-# should I add a signal receiver for setting_changed?
-changes_func = None
-
-
-def _changes_func() -> Callable[[LogEntry], Dict]:
-    def json_then_text(instance: LogEntry) -> Dict:
-        if instance.change_value:
-            return instance.change_value
-        return {}
-
-    def default(instance: LogEntry) -> Dict:
-        return instance.change_value or {}
-
-    if settings.AUDITLOG_USE_TEXT_CHANGES_IF_JSON_IS_NOT_PRESENT:
-        return json_then_text
-    return default
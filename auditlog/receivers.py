@@ -17,13 +17,10 @@ def check_disable(signal_handler):
 
     @wraps(signal_handler)
     def wrapper(*args, **kwargs):
-        try:
-            auditlog_disabled_value = auditlog_disabled.get()
-        except LookupError:
-            auditlog_disabled_value = False
-        if not auditlog_disabled_value and not (
-            kwargs.get("raw") and settings.AUDITLOG_DISABLE_ON_RAW_SAVE
-        ):
+        # auditlog_disabled has a default, so get() never raises LookupError
+        if auditlog_disabled.get():
+            return
+        if not (kwargs.get("raw") and settings.AUDITLOG_DISABLE_ON_RAW_SAVE):
             signal_handler(*args, **kwargs)
 
     return wrapper
@@ -157,8 +154,8 @@ def _create_log_entry(
             raise error
 
 
-def make_log_m2m_changes(field_name):
-    """Return a handler for m2m_changed with field_name enclosed."""
+def make_log_m2m_changes(field_name, display_field=None):
+    """Return a handler for m2m_changed with field_name and display_field enclosed."""
 
     @check_disable
     def log_m2m_changes(signal, action, **kwargs):
@@ -177,6 +174,7 @@ def make_log_m2m_changes(field_name):
                 kwargs["instance"],
                 "add",
                 field_name,
+                display_field=display_field,
             )
         elif action in ["post_remove", "post_clear"]:
             LogEntry.objects.log_m2m_changes(
@@ -184,6 +182,7 @@ def make_log_m2m_changes(field_name):
                 kwargs["instance"],
                 "delete",
                 field_name,
+                display_field=display_field,
             )
 
     return log_m2m_changes
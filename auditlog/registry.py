@@ -75,7 +75,7 @@ class AuditlogModelRegistry:
         exclude_fields: Optional[List[str]] = None,
         mapping_fields: Optional[Dict[str, str]] = None,
         mask_fields: Optional[List[str]] = None,
-        m2m_fields: Optional[Collection[str]] = None,
+        m2m_fields: Optional[Union[Collection[str], Dict[str, str]]] = None,
         serialize_data: bool = False,
         serialize_kwargs: Optional[Dict[str, Any]] = None,
         serialize_auditlog_fields_only: bool = False,
@@ -88,7 +88,8 @@ class AuditlogModelRegistry:
         :param exclude_fields: The fields to exclude. Overrides the fields to include.
         :param mapping_fields: Mapping from field names to strings in diff.
         :param mask_fields: The fields to mask for sensitive info.
-        :param m2m_fields: The fields to handle as many to many.
+        :param m2m_fields: The fields to handle as many to many. A dict maps each field to the field of the
+            related model that is logged instead of the related object's string representation.
         :param serialize_data: Option to include a dictionary of the objects state in the auditlog.
         :param serialize_kwargs: Optional kwargs to pass to Django serializer
         :param serialize_auditlog_fields_only: Only fields being considered in changes will be serialized.
@@ -202,8 +203,12 @@ class AuditlogModelRegistry:
                 dispatch_uid=self._dispatch_uid(signal, receiver),
             )
         if self._m2m:
-            for field_name in self._registry[model]["m2m_fields"]:
-                receiver = make_log_m2m_changes(field_name)
+            m2m_fields = self._registry[model]["m2m_fields"]
+            for field_name in m2m_fields:
+                display_field = (
+                    m2m_fields[field_name] if isinstance(m2m_fields, dict) else None
+                )
+                receiver = make_log_m2m_changes(field_name, display_field)
                 self._m2m_signals[model][field_name] = receiver
                 field = getattr(model, field_name)
                 m2m_model = getattr(field, "through")
@@ -10,26 +10,17 @@ from auditlog_tests.models import SimpleModel
 
 
 class TwoStepMigrationTest(TestCase):
-    def test_use_text_changes_first(self):
-        text_obj = '{"field": "changes_text"}'
+    def test_changes_dict(self):
         json_obj = {"field": "changes"}
         _params = [
-            (True, None, text_obj, {"field": "changes_text"}),
-            (True, json_obj, text_obj, json_obj),
-            (True, None, "not json", {}),
-            (False, json_obj, text_obj, json_obj),
+            (json_obj, json_obj),
+            (None, {}),
         ]
 
-        for setting_value, changes_value, changes_text_value, expected in _params:
+        for change_value, expected in _params:
             with self.subTest():
-                entry = LogEntry(changes=changes_value, changes_text=changes_text_value)
-                with self.settings(
-                    AUDITLOG_USE_TEXT_CHANGES_IF_JSON_IS_NOT_PRESENT=setting_value
-                ):
-                    from auditlog import models
-
-                    changes_dict = models._changes_func()(entry)
-                    self.assertEqual(changes_dict, expected)
+                entry = LogEntry(change_value=change_value)
+                self.assertEqual(entry.changes_dict, expected)
 
 
 class AuditlogMigrateJsonTest(TestCase):
@@ -3,7 +3,9 @@ import itertools
 import json
 import random
 import warnings
+from collections import namedtuple
 from datetime import timezone
+from decimal import Decimal
 from unittest import mock
 from unittest.mock import patch
 
@@ -16,9 +18,10 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
-from django.db import models
+from django.db import connection, models, transaction
 from django.db.models.signals import pre_save
 from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import resolve, reverse
 from django.utils import dateformat, formats
 from django.utils import timezone as django_timezone
@@ -26,7 +29,7 @@ from django.utils.encoding import smart_str
 
 from auditlog.admin import LogEntryAdmin
 from auditlog.cid import get_cid
-from auditlog.context import disable_auditlog, set_actor
+from auditlog.context import batch_auditlog, disable_auditlog, set_actor
 from auditlog.diff import model_instance_diff
 from auditlog.middleware import AuditlogMiddleware
 from auditlog.models import DEFAULT_OBJECT_REPR, LogEntry
@@ -58,7 +61,9 @@ from auditlog_tests.models import (
     SimpleModel,
     SimpleNonManagedModel,
     UUIDPrimaryKeyModel,
+    m2m_only_auditlog,
 )
+from auditlog_tests.views import SimpleModelDetailview, SimpleModelListView
 
 
 class SimpleModelTest(TestCase):
@@ -80,6 +85,12 @@ class SimpleModelTest(TestCase):
         history = obj.history.get()
         self.check_create_log_entry(obj, history)
 
+    def test_get_for_objects_only_returns_given_objects(self):
+        self.make_object()
+        queryset = type(self.obj).objects.filter(pk=self.obj.pk)
+
+        self.assertEqual(LogEntry.objects.get_for_objects(queryset).count(), 1)
+
     def check_create_log_entry(self, obj, history):
         self.assertEqual(
             history.action, LogEntry.Action.CREATE, msg="Action is 'CREATE'"
@@ -227,6 +238,33 @@ class SimpleModelTest(TestCase):
         history = self.obj.history.filter(timestamp=timestamp, changes="foo bar")
         self.assertTrue(history.exists())
 
+    def test_log_create_normalizes_change_value(self):
+        Change = namedtuple("Change", ["old", "new"])
+        log_entry = LogEntry.objects.log_create(
+            self.obj,
+            action=LogEntry.Action.UPDATE,
+            change_value={
+                "price": Change(Decimal("1.50"), Decimal("2.00")),
+                "date": [datetime.date(2020, 1, 2), self.obj],
+            },
+        )
+        log_entry.refresh_from_db()
+        self.assertEqual(
+            log_entry.change_value,
+            {"price": ["1.50", "2.00"], "date": ["2020-01-02", str(self.obj.pk)]},
+        )
+
+    def test_log_create_event_column_override(self):
+        with mock.patch.object(type(self.obj), "__str__") as str_mock:
+            log_entry = LogEntry.objects.log_create(
+                self.obj,
+                action=LogEntry.Action.UPDATE,
+                force_log=True,
+                event_column="custom",
+            )
+        str_mock.assert_not_called()
+        self.assertEqual(log_entry.event_column, "custom")
+
 
 class NoActorMixin:
     def check_create_log_entry(self, obj, log_entry):
@@ -418,6 +456,20 @@ class ManyRelatedModelTest(TestCase):
             },
         )
 
+    def test_changes_display_field(self):
+        m2m_only_auditlog.unregister(ManyRelatedModel)
+        m2m_only_auditlog.register(ManyRelatedModel, m2m_fields={"related": "id"})
+        self.addCleanup(
+            m2m_only_auditlog.register, ManyRelatedModel, m2m_fields={"related"}
+        )
+        self.addCleanup(m2m_only_auditlog.unregister, ManyRelatedModel)
+
+        self.obj.related.add(self.related)
+        log_entry = self.obj.history.first()
+        self.assertEqual(
+            log_entry.change_value["related"]["objects"], [smart_str(self.related.id)]
+        )
+
     def test_adding_existing_related_obj(self):
         self.obj.related.add(self.related)
         log_entry = self.obj.history.first()
@@ -1097,6 +1149,16 @@ class UnregisterTest(TestCase):
         # Check for log entries
         self.assertEqual(LogEntry.objects.count(), 0, msg="There are no log entries")
 
+    def test_unregister_changes_display_dict(self):
+        """Changes are displayed as recorded after unregistering."""
+        log_entry = LogEntry.objects.log_create(
+            self.obj,
+            action=LogEntry.Action.UPDATE,
+            change_value={"boolean": ["False", "True"]},
+        )
+
+        self.assertEqual(log_entry.changes_display_dict, log_entry.changes_dict)
+
 
 class RegisterModelSettingsTest(TestCase):
     def setUp(self):
@@ -1453,6 +1515,14 @@ class CharFieldTextFieldModelTest(TestCase):
             msg="The field should display the entire string because it is less than 140 characters",
         )
 
+    def test_changes_display_dict_non_string_values(self):
+        log_entry = LogEntry.objects.log_create(
+            self.obj,
+            action=LogEntry.Action.UPDATE,
+            change_value={"longchar": [None, 1]},
+        )
+        self.assertEqual(log_entry.changes_display_dict["longchar"], ["None", "1"])
+
 
 class PostgresArrayFieldModelTest(TestCase):
     databases = "__all__"
@@ -2029,6 +2099,25 @@ class TestRelatedDiffs(TestCase):
         self.assertEqual(display_dict["related"][0], "None")
         self.assertEqual(display_dict["one to one"][1], "Test Foo")
 
+    def test_fk_changes_display_dict_fetches_related_objects_once(self):
+        simple = SimpleModel.objects.create(text="Test Foo")
+        one_simple = SimpleModel.objects.create(text="Test Bar")
+        instance = RelatedModel.objects.create(one_to_one=simple, related=one_simple)
+        log_entry = LogEntry.objects.log_create(
+            instance,
+            action=LogEntry.Action.UPDATE,
+            change_value={
+                "related": [str(simple.pk), str(one_simple.pk)],
+                "one_to_one": [str(one_simple.pk), str(simple.pk)],
+            },
+        )
+
+        # Both fields reference SimpleModel: a single in_bulk query
+        with self.assertNumQueries(1):
+            display_dict = log_entry.changes_display_dict
+        self.assertEqual(display_dict["related"], ["Test Foo", "Test Bar"])
+        self.assertEqual(display_dict["one to one"], ["Test Bar", "Test Foo"])
+
     def test_log_entry_deleted_fk_changes_to_string_objects_in_display_dict(self):
         t1 = self.test_date
         with freezegun.freeze_time(t1):
@@ -2364,6 +2453,38 @@ class TestAccessLog(TestCase):
         self.assertIsNone(log_entry.changes)
         self.assertEqual(log_entry.changes_dict, {})
 
+    def test_batch_access_log(self):
+        other = SimpleModel.objects.create(text="Second object")
+
+        with mock.patch.object(
+            SimpleModelListView, "get_object", create=True
+        ) as get_object_mock, CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("simplemodel-list"))
+
+        self.assertEqual(response.status_code, 200)
+        get_object_mock.assert_not_called()
+        log_entry_inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("INSERT INTO")
+            and LogEntry._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(log_entry_inserts), 1)
+        for obj in (self.obj, other):
+            log_entries = LogEntry.objects.get_for_model(SimpleModel).filter(
+                identifier=str(obj.pk), action=LogEntry.Action.ACCESS
+            )
+            self.assertEqual(log_entries.count(), 1)
+
+    def test_batch_access_log_without_object_list(self):
+        with mock.patch.object(SimpleModelDetailview, "batch_access", True):
+            self.client.get(reverse("simplemodel-detail", args=[self.obj.pk]))
+
+        log_entries = LogEntry.objects.get_for_model(SimpleModel).filter(
+            identifier=str(self.obj.pk), action=LogEntry.Action.ACCESS
+        )
+        self.assertEqual(log_entries.count(), 1)
+
 
 class SignalTests(TestCase):
     def setUp(self):
@@ -2613,3 +2734,51 @@ class DisableTest(TestCase):
         self.assertEqual(0, LogEntry.objects.get_for_object(recursive).count())
         related = ManyRelatedOtherModel.objects.get(pk=1)
         self.assertEqual(0, LogEntry.objects.get_for_object(related).count())
+
+
+class BatchTest(TestCase):
+    def test_entries_written_on_exit(self):
+        with batch_auditlog():
+            first = SimpleModel.objects.create(text="first")
+            second = SimpleModel.objects.create(text="second")
+            self.assertEqual(0, LogEntry.objects.count())
+        self.assertEqual(1, LogEntry.objects.filter(identifier=str(first.pk)).count())
+        self.assertEqual(1, LogEntry.objects.filter(identifier=str(second.pk)).count())
+
+    def test_entries_discarded_on_exception(self):
+        with self.assertRaises(RuntimeError):
+            with batch_auditlog():
+                with transaction.atomic():
+                    SimpleModel.objects.create(text="rolled back")
+                    raise RuntimeError
+        self.assertEqual(0, SimpleModel.objects.count())
+        self.assertEqual(0, LogEntry.objects.count())
+
+    def test_changes_rolled_back_on_exception(self):
+        with self.assertRaises(RuntimeError):
+            with batch_auditlog():
+                SimpleModel.objects.create(text="rolled back")
+                raise RuntimeError
+        self.assertEqual(0, SimpleModel.objects.count())
+        self.assertEqual(0, LogEntry.objects.count())
+
+    def test_nested_exception(self):
+        with batch_auditlog():
+            try:
+                with transaction.atomic():
+                    with batch_auditlog():
+                        SimpleModel.objects.create(text="rolled back")
+                        raise RuntimeError
+            except RuntimeError:
+                pass
+            kept = SimpleModel.objects.create(text="kept")
+        self.assertEqual(1, SimpleModel.objects.count())
+        self.assertEqual(1, LogEntry.objects.count())
+        self.assertEqual(1, LogEntry.objects.filter(identifier=str(kept.pk)).count())
+
+    def test_nested(self):
+        with batch_auditlog():
+            with batch_auditlog():
+                SimpleModel.objects.create(text="nested")
+            self.assertEqual(0, LogEntry.objects.count())
+        self.assertEqual(1, LogEntry.objects.count())
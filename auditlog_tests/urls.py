@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.urls import path
 
-from auditlog_tests.views import SimpleModelDetailview
+from auditlog_tests.views import SimpleModelDetailview, SimpleModelListView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -10,4 +10,5 @@ urlpatterns = [
         SimpleModelDetailview.as_view(),
         name="simplemodel-detail",
     ),
+    path("simplemodel/", SimpleModelListView.as_view(), name="simplemodel-list"),
 ]
@@ -1,4 +1,4 @@
-from django.views.generic import DetailView
+from django.views.generic import DetailView, ListView
 
 from auditlog.mixins import LogAccessMixin
 from auditlog_tests.models import SimpleModel
@@ -7,3 +7,9 @@ from auditlog_tests.models import SimpleModel
 class SimpleModelDetailview(LogAccessMixin, DetailView):
     model = SimpleModel
     template_name = "simplemodel_detail.html"
+
+
+class SimpleModelListView(LogAccessMixin, ListView):
+    model = SimpleModel
+    template_name = "simplemodel_list.html"
+    batch_access = True